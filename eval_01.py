@@ -9,25 +9,59 @@ This program reads a CSV file (bord.csv) that contains survey data.
 It stores all lines in memory and offers 10 analysis options through
 a text-based menu.
 
+Start it with --stream to keep only the file path instead: options
+1, 3, 6 and 7 then re-read the file row by row, the other options load
+the file into memory the first time they are chosen.
+
 Each menu item is implemented in its own function, as required.
 The code follows PEP8, includes type hints, comments, and handles
 errors gracefully.
+
+The module is fully type-annotated, so it can also be compiled to a C
+extension with mypyc for faster analysis of large files:
+    pip install mypy && mypyc eval_01.py
+    python -c "import eval_01; eval_01.main()"
 """
 
-from typing import List, Dict
+from collections import Counter
+from functools import wraps
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, cast
 import csv
+import os
+import re
 import sys
 
+C = TypeVar("C")
+T = TypeVar("T")
+
+# Column indexes of the survey file
+ID, STARTED, SENT, NUMBER, PLACE, COLOR, Q_WORD = range(7)
+
+# Menu options that only need a single pass over the rows (see --stream)
+STREAMED_OPTIONS = {"1", "3", "6", "7"}
+
+# A valid number: optional sign, comma or dot decimals, optional exponent.
+# Digits may be grouped with single underscores ("1_000"), as float() accepts;
+# only nan and inf are rejected on purpose
+_DIGITS = r"\d+(?:_\d+)*"
+NUMBER_RE = re.compile(
+    rf"\s*[+-]?(?:{_DIGITS}(?:[.,](?:{_DIGITS})?)?|[.,]{_DIGITS})(?:[eE][+-]?{_DIGITS})?\s*"
+)
+
+# Results derived from the loaded contents, keyed by helper function name.
+# The contents never change after loading, so the cache only needs to be
+# cleared when a (new) file is chosen.
+_cache: Dict[str, Any] = {}
+
 
 # ============================================================
 # A) Reading the CSV file
 # ============================================================
-def read_csv_file() -> List[List[str]]:
+def ask_csv_path() -> str:
     """
-    Ask the user for the path to a CSV file until a valid one is read.
+    Ask the user for the path to a CSV file until an existing one is given.
     If the user types STOP, the program ends.
-    The function skips the header line and returns a list of lists
-    containing all rows from the file.
     """
     while True:
         path = input("Enter path to CSV file (or type STOP to exit): ").strip()
@@ -37,25 +71,198 @@ def read_csv_file() -> List[List[str]]:
             print("Program stopped by user.")
             sys.exit(0)
 
+        if os.path.isfile(path):
+            _cache.clear()  # results of a previous file are no longer valid
+            return path
+        print("⚠️ File not found. Please try again.")
+
+
+def iter_rows(path: str) -> Iterator[List[str]]:
+    """
+    Yield all non-empty rows of a CSV file, skipping the header line.
+    The file is read lazily: only the current row is kept in memory.
+    """
+    with open(path, encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=";")
+        next(reader, None)  # skip column names
+        # filter(None, ...) drops empty rows without a Python-level loop
+        yield from filter(None, reader)
+
+
+def load_rows(path: str) -> List[List[str]]:
+    """Read all rows of a CSV file into a list of lists."""
+    contents = list(iter_rows(path))
+    print(f"✅ File successfully loaded: {len(contents)} records found.")
+    return contents
+
+
+def read_csv_file() -> List[List[str]]:
+    """
+    Ask the user for the path to a CSV file until a valid one is read.
+    If the user types STOP, the program ends.
+    The function skips the header line and returns a list of lists
+    containing all rows from the file.
+    """
+    while True:
+        path = ask_csv_path()
         try:
-            with open(path, encoding="utf-8") as file:
-                reader = csv.reader(file, delimiter=";")
-                next(reader)  # skip column names
-                contents = [row for row in reader if row]
-                print(f"✅ File successfully loaded: {len(contents)} records found.")
-                return contents
-        except FileNotFoundError:
-            print("⚠️ File not found. Please try again.")
+            return load_rows(path)
         except Exception as e:
             print(f"⚠️ Error reading file: {e}")
 
 
+def memoize(func: Callable[[C], T]) -> Callable[[C], T]:
+    """
+    Decorator for the analysis helpers below.
+    The result is computed on the first call and taken from the cache
+    on every next call, so choosing a menu option twice costs nothing.
+    """
+    @wraps(func)
+    def wrapper(contents: C) -> T:
+        if func.__name__ not in _cache:
+            _cache[func.__name__] = func(contents)
+        return cast(T, _cache[func.__name__])
+
+    return wrapper
+
+
+def get_column(contents: Iterable[List[str]], index: int) -> Iterable[str]:
+    """
+    Return one column of the contents.
+    For contents in memory the column is extracted once and cached, so the
+    analysis helpers iterate over a flat list instead of indexing every row
+    again. Streamed rows (--stream) give a lazy iterator instead.
+    Rows that are too short for the column are skipped.
+    """
+    if not isinstance(contents, list):
+        return (row[index] for row in contents if len(row) > index)
+
+    key = f"column {index}"
+    if key not in _cache:
+        _cache[key] = [row[index] for row in contents if len(row) > index]
+    return cast(List[str], _cache[key])
+
+
 # ============================================================
-# B) Menu item functions
+# B) Analysis helpers (cached) and menu item functions
 # ============================================================
-def print_line_count(contents: List[List[str]]) -> None:
+@memoize
+def get_unique_dates(contents: Iterable[List[str]]) -> List[str]:
+    """Return the sorted unique start dates (date portion only)."""
+    # partition() only cuts off the first token, split() would build a list
+    starts = get_column(contents, STARTED)
+    unique_dates = {started.partition(" ")[0] for started in starts if started}
+    return sorted(unique_dates)
+
+
+@memoize
+def get_numbers(contents: List[List[str]]) -> List[float]:
+    """Return all valid values of the 'random number' column as floats."""
+    # The compiled pattern rejects invalid values without raising exceptions
+    match = NUMBER_RE.fullmatch
+    return [float(val.replace(",", ".")) for val in get_column(contents, NUMBER) if match(val)]
+
+
+@memoize
+def get_color_counts(contents: List[List[str]]) -> Counter[str]:
+    """Return how many times each color appears (upper case)."""
+    # Count the raw values first, so every distinct spelling is only
+    # stripped and upper-cased once instead of once per row
+    color_counts: Counter[str] = Counter()
+    for raw, count in Counter(get_column(contents, COLOR)).items():
+        color = raw.strip().upper()
+        if color:
+            color_counts[color] += count
+    return color_counts
+
+
+@memoize
+def get_places(contents: Iterable[List[str]]) -> List[str]:
+    """Return the sorted unique place names (title case)."""
+    # Deduplicate the raw values first: each distinct spelling is normalized once
+    places = {place.strip().title() for place in set(get_column(contents, PLACE))}
+    places.discard("")
+    return sorted(places)
+
+
+@memoize
+def get_participation(contents: Iterable[List[str]]) -> Tuple[int, int]:
+    """
+    Return the total number of submissions and the number of submissions
+    with a filled 'datestamp' column, counted in a single pass.
+    """
+    total = complete = 0
+    for row in contents:
+        total += 1
+        if len(row) > SENT and row[SENT].strip():
+            complete += 1
+    return total, complete
+
+
+@memoize
+def get_missing_ids(contents: List[List[str]]) -> Optional[List[int]]:
+    """
+    Return the IDs missing from the consecutive range of IDs,
+    or None when the file contains no valid IDs at all.
+    """
+    # isdecimal() accepts exactly what int() can parse ('²' is a digit, not a decimal)
+    ids = list(map(int, filter(str.isdecimal, get_column(contents, ID))))
+    if not ids:
+        return None
+
+    # Bitmap of the whole range, one byte per ID: 1 = missing, 0 = present.
+    # compress() then picks the missing IDs from the range in C.
+    lowest, highest = min(ids), max(ids)
+    missing = bytearray(b"\x01") * (highest - lowest + 1)
+    for i in ids:
+        missing[i - lowest] = 0
+    return list(compress(range(lowest, highest + 1), missing))
+
+
+def count_q(words: Iterable[str]) -> Tuple[int, int, int]:
+    """
+    Count the words that start with 'q', contain 'q' elsewhere or
+    contain no 'q' at all (case-insensitive).
+    A single find() per word classifies it in one scan.
+    """
+    start_q = mid_q = no_q = 0
+    for word in words:
+        position = word.strip().lower().find("q")
+        if position < 0:
+            no_q += 1
+        elif position == 0:
+            start_q += 1
+        else:
+            mid_q += 1
+    return start_q, mid_q, no_q
+
+
+@memoize
+def get_q_counts(contents: List[List[str]]) -> Tuple[int, int, int]:
+    """Return the Q-word counts of the 'Q-word' column."""
+    return count_q(get_column(contents, Q_WORD))
+
+
+@memoize
+def get_filtered_lines(contents: List[List[str]]) -> List[List[str]]:
+    """
+    Return id, number, color and Q-word of all rows with a valid
+    numeric value and a Q-word that starts with 'Q'.
+    """
+    valid_lines = []
+    for row in contents:
+        # Cheap Q-word check first: the number is only validated for the remaining rows
+        if len(row) < 7 or not row[6].strip().lower().startswith("q"):
+            continue
+        if NUMBER_RE.fullmatch(row[3]):
+            valid_lines.append([row[0], row[3], row[5], row[6]])
+    return valid_lines
+
+
+def print_line_count(contents: Iterable[List[str]]) -> None:
     """1) Print the number of lines in the dataset."""
-    print(f"There are {len(contents)} lines in the file.")
+    count = len(contents) if isinstance(contents, list) else sum(1 for _ in contents)
+    print(f"There are {count} lines in the file.")
 
 
 def print_contents(contents: List[List[str]]) -> None:
@@ -63,27 +270,28 @@ def print_contents(contents: List[List[str]]) -> None:
     2) Print all contents line by line, formatted with column values.
     The id column is NOT the same as the line number.
     """
+    # Collect all lines first and write them with a single call
+    lines: List[str] = []
+    append = lines.append
     for i, row in enumerate(contents, start=1):
-        try:
-            print(
-                f"Line {i}, started on {row[1]}, sent on {row[2]}, "
-                f"{row[3]}, {row[4]}, {row[5]}, {row[6]}"
-            )
-        except IndexError:
-            print(f"⚠️ Line {i} is incomplete and was skipped.")
+        if len(row) <= Q_WORD:
+            append(f"⚠️ Line {i} is incomplete and was skipped.")
+            continue
+        _, started, sent, number, place, color, q_word = row[:Q_WORD + 1]
+        append(
+            f"Line {i}, started on {started}, sent on {sent}, "
+            f"{number}, {place}, {color}, {q_word}"
+        )
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def print_unique_dates(contents: List[List[str]]) -> None:
+def print_unique_dates(contents: Iterable[List[str]]) -> None:
     """
     3) Show all unique start dates (day/month/year).
     Extracts only the date portion before the time.
     """
-    unique_dates = set()
-    for row in contents:
-        if len(row) > 1 and row[1]:
-            date = row[1].split(" ")[0]
-            unique_dates.add(date)
-    print("Unique submission dates:", sorted(unique_dates))
+    print("Unique submission dates:", get_unique_dates(contents))
 
 
 def print_number_stats(contents: List[List[str]]) -> None:
@@ -91,14 +299,7 @@ def print_number_stats(contents: List[List[str]]) -> None:
     4) Print average, minimum, and maximum for the 'random number' column.
     Handles both comma and dot decimals, ignores invalid values.
     """
-    numbers = []
-    for row in contents:
-        if len(row) > 3:
-            val = row[3].replace(",", ".").strip()
-            try:
-                numbers.append(float(val))
-            except ValueError:
-                continue
+    numbers = get_numbers(contents)
     if numbers:
         avg = sum(numbers) / len(numbers)
         print(f"Average: {avg}")
@@ -113,11 +314,7 @@ def print_color_stats(contents: List[List[str]]) -> None:
     5) Count how many times each color appears (case-insensitive).
     Also prints which color appears the most.
     """
-    color_counts: Dict[str, int] = {}
-    for row in contents:
-        if len(row) > 5 and row[5].strip():
-            color = row[5].strip().upper()
-            color_counts[color] = color_counts.get(color, 0) + 1
+    color_counts = get_color_counts(contents)
 
     # Display all colors with their counts
     for color, count in color_counts.items():
@@ -125,25 +322,23 @@ def print_color_stats(contents: List[List[str]]) -> None:
 
     # Identify the most frequent color
     if color_counts:
-        most_common = max(color_counts, key=color_counts.get)
+        most_common = color_counts.most_common(1)[0][0]
         print(f"The most common color is: {most_common}")
 
 
-def print_places(contents: List[List[str]]) -> None:
+def print_places(contents: Iterable[List[str]]) -> None:
     """
     6) Print all unique place names (case-insensitive, no duplicates).
     """
-    places = {row[4].strip().title() for row in contents if len(row) > 4 and row[4].strip()}
-    print("Unique places:", sorted(places))
+    print("Unique places:", get_places(contents))
 
 
-def print_participation_stats(contents: List[List[str]]) -> None:
+def print_participation_stats(contents: Iterable[List[str]]) -> None:
     """
     7) Count the number of complete and incomplete submissions.
     A submission is complete if the 'datestamp' column is filled.
     """
-    total = len(contents)
-    complete = sum(1 for row in contents if len(row) > 2 and row[2].strip())
+    total, complete = get_participation(contents)
     incomplete = total - complete
     print(f"There are {total} submissions: {complete} complete and {incomplete} incomplete.")
 
@@ -153,13 +348,10 @@ def print_id_stats(contents: List[List[str]]) -> None:
     8) Check if the ID column is consistent (consecutive integers).
     Prints which IDs are missing.
     """
-    ids = sorted(int(row[0]) for row in contents if row[0].isdigit())
-    if not ids:
+    missing = get_missing_ids(contents)
+    if missing is None:
         print("⚠️ No valid IDs found.")
-        return
-
-    missing = [i for i in range(min(ids), max(ids) + 1) if i not in ids]
-    if missing:
+    elif missing:
         print("Missing ID values:", missing)
     else:
         print("All IDs are consecutive and valid.")
@@ -172,16 +364,7 @@ def print_q_stats(contents: List[List[str]]) -> None:
        - contain 'Q' elsewhere
        - contain no 'Q'
     """
-    start_q = mid_q = no_q = 0
-    for row in contents:
-        if len(row) > 6:
-            word = row[6].strip().lower()
-            if "q" not in word:
-                no_q += 1
-            elif word.startswith("q"):
-                start_q += 1
-            else:
-                mid_q += 1
+    start_q, mid_q, no_q = get_q_counts(contents)
     print(f"{start_q} words start with 'Q'")
     print(f"{mid_q} words contain 'Q' but not at the start")
     print(f"{no_q} words contain no 'Q'")
@@ -195,21 +378,11 @@ def save_filtered(contents: List[List[str]]) -> None:
     into a new CSV file with columns: id;number;color;q-word
     """
     filename = input("Enter name of output file (e.g. output.csv): ").strip()
-    valid_lines = []
-
-    for row in contents:
-        try:
-            number = float(row[3].replace(",", "."))
-            qword = row[6].strip().lower()
-            if qword.startswith("q"):
-                valid_lines.append([row[0], row[3], row[5], row[6]])
-        except (ValueError, IndexError):
-            continue
+    valid_lines = get_filtered_lines(contents)
 
     try:
-        with open(filename, "w", encoding="utf-8") as file:
-            for line in valid_lines:
-                file.write(";".join(line) + "\n")
+        with open(filename, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file, delimiter=";", lineterminator="\n").writerows(valid_lines)
         print(f"✅ Saved {len(valid_lines)} valid lines to {filename}")
     except Exception as e:
         print(f"⚠️ Error saving file: {e}")
@@ -218,15 +391,21 @@ def save_filtered(contents: List[List[str]]) -> None:
 # ============================================================
 # C) Main program (menu system)
 # ============================================================
-def main() -> None:
+def main(stream: bool = False) -> None:
     """
     The main menu loop.
     Displays all 10 options and lets the user select one.
     Typing STOP ends the program.
+    In stream mode only the path is kept and the rows are read when needed.
     """
-    contents = read_csv_file()
+    path = ""
+    contents: Optional[List[List[str]]] = None
+    if stream:
+        path = ask_csv_path()
+    else:
+        contents = read_csv_file()
 
-    menu_options = {
+    menu_options: Dict[str, Callable[..., None]] = {
         "1": print_line_count,
         "2": print_contents,
         "3": print_unique_dates,
@@ -262,6 +441,16 @@ def main() -> None:
             print("👋 Program stopped.")
             break
         elif choice in menu_options:
+            try:
+                if stream and choice in STREAMED_OPTIONS:
+                    # Single-pass option: re-read the file row by row
+                    menu_options[choice](iter_rows(path))
+                    continue
+                if contents is None:
+                    contents = load_rows(path)
+            except Exception as e:
+                print(f"⚠️ Error reading file: {e}")
+                continue
             menu_options[choice](contents)
         else:
             print("⚠️ Invalid option. Please choose a number between 1–10 or type STOP.")
@@ -271,4 +460,4 @@ def main() -> None:
 # D) Run the program
 # ============================================================
 if __name__ == "__main__":
-    main()
+    main(stream="--stream" in sys.argv[1:])
@@ -5,10 +5,13 @@ This is the main module of the test for module 2: Object Oriented Programming
 # python imports
 import csv
 import os
+from collections import Counter
+from datetime import datetime
 from typing import List
 
 # custom imports
-from module02.movie import Movie, create_movie
+from module02.movie import Movie, Horror, create_movie
+from module02.person import Person
 
 # Constants
 MOVIE_FILE = "reviews.csv"  # Update for your system
@@ -53,8 +56,6 @@ def print_number_of_movies(movies: List[Movie]) -> None:
 
 def print_movies_per_genre(movies: List[Movie]) -> None:
     """Print a list of genres and how many times each occurs, sorted by count."""
-    from collections import Counter
-
     genre_count = Counter()
     for movie in movies:
         # Get the class name (e.g., 'Comedy', 'Horror')
@@ -69,26 +70,27 @@ def print_movies_per_genre(movies: List[Movie]) -> None:
 
 def count_person_objects() -> None:
     """Print how many Person objects have been created."""
-    from module02.person.person import Person
     # Person._persons is the class variable storing all persons
     print(f"\nNumber of Person objects created: {len(Person._persons)}")
 
 
 def print_highest_scoring_movies(movies: List[Movie]) -> None:
     """Print the movie(s) with the highest relevant score."""
-    # Filter movies with relevant scores
-    relevant_movies = [m for m in movies if m.relevant_score()]
-
-    if not relevant_movies:
+    # Single pass: track the highest relevant score and the movies that have it
+    highest_score = None
+    top_movies = []
+    for movie in movies:
+        if not movie.relevant_score():
+            continue
+        if highest_score is None or movie.score > highest_score:
+            highest_score, top_movies = movie.score, [movie]
+        elif movie.score == highest_score:
+            top_movies.append(movie)
+
+    if highest_score is None:
         print("\nNo movies with relevant scores found.")
         return
 
-    # Find highest score
-    highest_score = max(m.score for m in relevant_movies if m.score is not None)
-
-    # Find all movies with that score
-    top_movies = [m for m in relevant_movies if m.score == highest_score]
-
     print(f"\nHighest score: {highest_score}%")
     print(f"Number of movies with this score: {len(top_movies)}")
     print("-" * 40)
@@ -98,8 +100,6 @@ def print_highest_scoring_movies(movies: List[Movie]) -> None:
 
 def print_most_active_directors(movies: List[Movie]) -> None:
     """Print the director(s) who directed the most films."""
-    from collections import Counter
-
     director_count = Counter()
     for movie in movies:
         for director in movie.directors:
@@ -109,11 +109,14 @@ def print_most_active_directors(movies: List[Movie]) -> None:
         print("\nNo directors found.")
         return
 
-    # Find max count
-    max_count = max(director_count.values())
-
-    # Find all directors with that count
-    top_directors = [name for name, count in director_count.items() if count == max_count]
+    # Find the max count and all directors with that count in one pass
+    max_count = 0
+    top_directors = []
+    for name, count in director_count.items():
+        if count > max_count:
+            max_count, top_directors = count, [name]
+        elif count == max_count:
+            top_directors.append(name)
 
     print(f"\nMost active director(s) directed {max_count} films:")
     print("-" * 40)
@@ -123,21 +126,27 @@ def print_most_active_directors(movies: List[Movie]) -> None:
 
 def print_shortest_longest_movies(movies: List[Movie]) -> None:
     """Print the shortest and longest movie(s)."""
-    # Filter movies with known length
-    movies_with_length = [m for m in movies if m.length is not None]
-
-    if not movies_with_length:
+    # Single pass: track min and max length and the movies that have them
+    min_length = max_length = None
+    shortest_movies = []
+    longest_movies = []
+    for movie in movies:
+        length = movie.length
+        if length is None:
+            continue
+        if min_length is None or length < min_length:
+            min_length, shortest_movies = length, [movie]
+        elif length == min_length:
+            shortest_movies.append(movie)
+        if max_length is None or length > max_length:
+            max_length, longest_movies = length, [movie]
+        elif length == max_length:
+            longest_movies.append(movie)
+
+    if min_length is None:
         print("\nNo movies with length information found.")
         return
 
-    # Find min and max length
-    min_length = min(m.length for m in movies_with_length)
-    max_length = max(m.length for m in movies_with_length)
-
-    # Find all movies with those lengths
-    shortest_movies = [m for m in movies_with_length if m.length == min_length]
-    longest_movies = [m for m in movies_with_length if m.length == max_length]
-
     print(f"\nSHORTEST movies ({min_length} minutes):")
     print("-" * 40)
     for movie in shortest_movies:
@@ -151,8 +160,6 @@ def print_shortest_longest_movies(movies: List[Movie]) -> None:
 
 def print_scary_horror_movies(movies: List[Movie]) -> None:
     """Print all horror films that are scary."""
-    from module02.movie.movie import Horror
-
     horror_movies = [m for m in movies if isinstance(m, Horror)]
 
     if not horror_movies:
@@ -169,19 +176,13 @@ def print_scary_horror_movies(movies: List[Movie]) -> None:
 
 def print_score_distribution(movies: List[Movie]) -> None:
     """Print all scores from 0 to 100 and how many movies have each score."""
-    from collections import Counter
-
-    # Count scores for movies with scores
-    score_count = Counter()
-    for movie in movies:
-        if movie.score is not None:
-            score_count[movie.score] += 1
+    # Count scores for movies with scores (Counter counts an iterable in C)
+    score_count = Counter(movie.score for movie in movies if movie.score is not None)
 
     print("\nScore distribution (0-100%):")
     print("-" * 40)
-    for score in range(101):
-        count = score_count.get(score, 0)
-        print(f"{score:3}%: {count}")
+    # Build the whole table first and print it with a single call
+    print("\n".join(f"{score:3}%: {score_count[score]}" for score in range(101)))
 
 
 def export_movies_without_relevant_score(movies: List[Movie], export_file: str) -> None:
@@ -202,7 +203,6 @@ def export_movies_without_relevant_score(movies: List[Movie], export_file: str)
     try:
         with open(export_file, 'w', encoding='UTF-8', newline='') as file:
             # Create CSV writer
-            import csv
             writer = csv.writer(file)
 
             # Write header
@@ -307,25 +307,27 @@ def main():
         print(f"Unexpected error: {e}")
 
 # Alle films uitgebracht tussen 1/4/2000 en 1/4/2005 korter dan 120 minuten.
-from datetime import datetime
-
-def option_11_filter_movies(movies):
+def option_11_filter_movies(movies: List[Movie]) -> None:
+    """
+    Print all movies released between 1/4/2000 and 1/4/2005
+    that are shorter than 120 minutes.
+    """
     start_date = datetime(2000, 4, 1)
     end_date = datetime(2005, 4, 1)
 
     print("\n--- Option 11: Movies released between 1/4/2000 and 1/4/2005 shorter than 120 minutes ---")
 
+    # create_movie already parsed release_date into a datetime (or None),
+    # so the dates can be compared directly without any strptime call
     found = False
     for movie in movies:
+        release = movie.release_date
+        length = movie.length
+        if release is None or length is None:
+            continue
 
-        # release_date may already be a datetime object
-        if isinstance(movie.release_date, datetime):
-            release = movie.release_date
-        else:
-            release = datetime.strptime(movie.release_date, "%Y-%m-%d")
-
-        if start_date <= release <= end_date and movie.length < 120:
-            print(f"- {movie.title} ({movie.length} min, {release.date()})")
+        if start_date <= release <= end_date and length < 120:
+            print(f"- {movie.title} ({length} min, {release.date()})")
             found = True
 
     if not found:
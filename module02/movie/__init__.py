@@ -13,8 +13,10 @@ from .movie import (
     Romance,
     ScienceFictionFantasy,
     Western,
-    create_movie
+    create_movie,
+    create_movies_parallel
 )
+from .movie_table import MovieTable
 
 # Define what gets imported with "from module02.movie import *"
 __all__ = [
@@ -28,7 +30,9 @@ __all__ = [
     'Romance',
     'ScienceFictionFantasy',
     'Western',
-    'create_movie'
+    'create_movie',
+    'create_movies_parallel',
+    'MovieTable'
 ]
 
 # Package metadata
@@ -2,20 +2,48 @@
 Movie classes: Abstract Base Class and genre-specific subclasses.
 """
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple, Type, Union
 
 # Import from our other modules
 from module02.movie.rating import MovieRating, get_rating
 from module02.person.person import Person, get_person
 
+# Looked up once: Horror.is_scary compares every horror movie against it
+_PG_RATING = get_rating("PG")
+
+# Current year for is_classic, determined once instead of on every call
+CURRENT_YEAR = datetime.now().year
+
 
 class Movie(ABC):
     """
     Abstract Base Class for all movies.
+
+    The movie fields are public attributes that are read-only by convention:
+    plain slots instead of getter properties, so reading a field is a single
+    attribute lookup instead of a function call. Score and count stay real
+    read-only properties, because the cached relevance is derived from them.
     """
 
+    # No per-instance __dict__: less memory per movie and faster attribute access
+    __slots__ = ('rt_link', 'title', 'rating', 'directors', 'release_date',
+                 'streaming_date', 'length', 'company', '_score', '_count',
+                 '_relevant')
+
+    rt_link: str
+    title: str
+    rating: MovieRating
+    directors: Tuple[Person, ...]
+    release_date: Optional[datetime]
+    streaming_date: Optional[datetime]
+    length: Optional[int]
+    company: Optional[str]
+
     def __init__(
             self,
             rt_link: str,
@@ -49,56 +77,19 @@ class Movie(ABC):
         if rating is None:
             raise ValueError("rating cannot be None")
 
-        self._rt_link = rt_link
-        self._title = title
-        self._rating = rating
-        self._directors = directors if directors is not None else []
-        self._release_date = release_date
-        self._streaming_date = streaming_date
-        self._length = length
-        self._company = company
+        self.rt_link = rt_link
+        self.title = title
+        self.rating = rating
+        # A tuple is immutable by construction, so it can be handed out without copying
+        self.directors = tuple(directors) if directors else ()
+        self.release_date = release_date
+        self.streaming_date = streaming_date
+        self.length = length
+        self.company = company
         self._score = score
         self._count = count
-
-    @property
-    def rt_link(self) -> str:
-        """Get the Rotten Tomatoes link."""
-        return self._rt_link
-
-    @property
-    def title(self) -> str:
-        """Get the movie title."""
-        return self._title
-
-    @property
-    def rating(self) -> MovieRating:
-        """Get the movie rating."""
-        return self._rating
-
-    @property
-    def directors(self) -> List[Person]:
-        """Get the list of directors."""
-        return self._directors.copy()  # Return copy to prevent modification
-
-    @property
-    def release_date(self) -> Optional[datetime]:
-        """Get the release date."""
-        return self._release_date
-
-    @property
-    def streaming_date(self) -> Optional[datetime]:
-        """Get the streaming release date."""
-        return self._streaming_date
-
-    @property
-    def length(self) -> Optional[int]:
-        """Get the movie length in minutes."""
-        return self._length
-
-    @property
-    def company(self) -> Optional[str]:
-        """Get the production company."""
-        return self._company
+        # Score and count are read-only, so relevance is determined once here
+        self._relevant = score is not None and count is not None and count >= 100
 
     @property
     def score(self) -> Optional[int]:
@@ -118,7 +109,7 @@ class Movie(ABC):
         Returns:
             True if score is relevant, False otherwise
         """
-        return self._score is not None and self._count is not None and self._count >= 100
+        return self._relevant
 
     def is_classic(self) -> bool:
         """
@@ -128,16 +119,14 @@ class Movie(ABC):
         Returns:
             True if film is a classic, False otherwise
         """
-        if not self.relevant_score() or self._score <= 80:
+        if not self._relevant or self._score <= 80:
             return False
 
-        if not self._release_date:
+        if not self.release_date:
             return False
 
         # Calculate age
-        current_year = datetime.now().year
-        release_year = self._release_date.year
-        age = current_year - release_year
+        age = CURRENT_YEAR - self.release_date.year
 
         return age >= 20
 
@@ -148,7 +137,7 @@ class Movie(ABC):
         Returns:
             True if film is a short film, False otherwise
         """
-        return self._length is not None and self._length < 30
+        return self.length is not None and self.length < 30
 
     def url(self) -> str:
         """
@@ -157,27 +146,29 @@ class Movie(ABC):
         Returns:
             Full URL: https://www.rottentomatoes.com/ + rt_link
         """
-        return f"https://www.rottentomatoes.com/{self._rt_link}"
+        return f"https://www.rottentomatoes.com/{self.rt_link}"
 
     def __repr__(self) -> str:
         """String representation of the movie."""
-        directors_str = ", ".join([d.full_name for d in self._directors]) if self._directors else "Unknown"
-        return f"{self.__class__.__name__}('{self._title}', {self._rating}, Directors: {directors_str})"
+        directors_str = ", ".join([d.full_name for d in self.directors]) if self.directors else "Unknown"
+        return f"{self.__class__.__name__}('{self.title}', {self.rating}, Directors: {directors_str})"
 
     def __str__(self) -> str:
         """String representation of the movie."""
-        return f"{self._title} ({self._rating})"
+        return f"{self.title} ({self.rating})"
 
 
 # Genre subclasses
 class ActionAdventure(Movie):
     """Action & Adventure genre."""
-    pass
+    __slots__ = ()
 
 
 class Comedy(Movie):
     """Comedy genre."""
 
+    __slots__ = ()
+
     def is_slapstick(self) -> bool:
         """
         A comedy is slapstick if its relevant score is less than 40.
@@ -185,17 +176,19 @@ class Comedy(Movie):
         Returns:
             True if slapstick comedy, False otherwise
         """
-        return self.relevant_score() and self._score is not None and self._score < 40
+        return self._relevant and self._score < 40
 
 
 class Drama(Movie):
     """Drama genre."""
-    pass
+    __slots__ = ()
 
 
 class Horror(Movie):
     """Horror genre."""
 
+    __slots__ = ()
+
     def is_scary(self) -> bool:
         """
         A horror film is scary if its rating is higher than PG.
@@ -205,14 +198,14 @@ class Horror(Movie):
         Returns:
             True if scary horror film, False otherwise
         """
-        from module02.movie.rating import get_rating
-        pg_rating = get_rating("PG")
-        return self._rating > pg_rating
+        return self.rating > _PG_RATING
 
 
 class Romance(Movie):
     """Romance genre."""
 
+    __slots__ = ()
+
     def is_cosy(self) -> bool:
         """
         A romance film is cosy if its length is between 70 and 100 minutes.
@@ -220,79 +213,131 @@ class Romance(Movie):
         Returns:
             True if cosy romance film, False otherwise
         """
-        return self._length is not None and 70 <= self._length <= 100
+        return self.length is not None and 70 <= self.length <= 100
 
 
 class ScienceFictionFantasy(Movie):
     """Science Fiction & Fantasy genre."""
-    pass
+    __slots__ = ()
 
 
 class Western(Movie):
     """Western genre."""
-    pass
+    __slots__ = ()
+
+
+# Genre name as used in the csv file -> Movie subclass
+GENRE_MAP = {
+    'ACTION & ADVENTURE': ActionAdventure,
+    'COMEDY': Comedy,
+    'DRAMA': Drama,
+    'HORROR': Horror,
+    'ROMANCE': Romance,
+    'SCIENCE FICTION & FANTASY': ScienceFictionFantasy,
+    'WESTERN': Western
+}
+
+# The same map with the lower case and title case spellings added, so the
+# usual spellings are found without calling upper() for every row
+_GENRE_MAP_CI = {
+    spelling: genre_class
+    for name, genre_class in GENRE_MAP.items()
+    for spelling in (name, name.lower(), name.title())
+}
+
+
+@lru_cache(maxsize=None)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date in the format YYYY-MM-DD.
 
+    Dates repeat a lot in a catalog (many movies share a streaming date),
+    so the result is cached and every distinct string is parsed only once.
 
-# Factory function
-def create_movie(movie_info: dict) -> Movie:
+    Args:
+        date_str: Date string from the csv file
+
+    Returns:
+        datetime object, or None if the date cannot be parsed
     """
-    Create a Movie object based on the genre.
+    try:
+        if (len(date_str) == 10 and date_str[4] == date_str[7] == '-' and date_str.isascii()
+                and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+            # Fast path for the usual zero-padded form: slicing and int()
+            # avoid the regex machinery behind strptime. Only plain digits
+            # get here, because int() also accepts spaces, signs and underscores
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+class _ParsedRow(NamedTuple):
+    """Plain values of one csv row, as returned by _parse_row."""
+    genre_class: Type[Movie]
+    rt_link: str
+    title: str
+    rating_code: str
+    director_names: Tuple[str, ...]
+    release_date: Optional[datetime]
+    streaming_date: Optional[datetime]
+    length: Optional[int]
+    company: Optional[str]
+    score: Optional[int]
+    count: Optional[int]
+
+
+def _parse_row(movie_info: dict) -> _ParsedRow:
+    """
+    Parse one csv row into plain values: all string conversion of create_movie.
+
+    The flyweight registries (ratings, persons) are not touched here, so
+    this is the hot part of the ingestion that can be compiled or run
+    separately from the Movie construction.
 
     Args:
         movie_info: Dictionary from csv.DictReader
 
     Returns:
-        Movie object of the appropriate genre subclass
+        _ParsedRow with the converted values
 
     Raises:
         ValueError: If genre doesn't exist or required fields are missing
     """
+    # Bind the lookup method once instead of resolving it for every field
+    g = movie_info.get
+
     # Required fields validation
-    rt_link = movie_info.get('rotten_tomatoes_link')
-    title = movie_info.get('movie_title')
-    rating_code = movie_info.get('content_rating')
-    genre = movie_info.get('genre')
+    rt_link = g('rotten_tomatoes_link')
+    title = g('movie_title')
+    rating_code = g('content_rating')
+    genre = g('genre')
 
     if not rt_link or not title or not rating_code or not genre:
         raise ValueError("Missing required fields")
 
-    # Get rating object
-    try:
-        rating = get_rating(rating_code)
-    except ValueError:
-        raise ValueError(f"Invalid rating code: {rating_code}")
-
     # Parse directors
-    directors_str = movie_info.get('directors', '')
-    directors = []
-    if directors_str:
+    directors_str = g('directors', '')
+    director_names: Tuple[str, ...] = ()
+    if directors_str and "," not in directors_str:
+        # Fast path for the common single-director case: nothing to split
+        name = directors_str.strip()
+        if name:
+            director_names = (name,)
+    elif directors_str:
         # Split by comma and handle multiple directors
-        director_names = [name.strip() for name in directors_str.split(",") if name.strip()]
-        directors = [get_person(name) for name in director_names]
+        director_names = tuple(name.strip() for name in directors_str.split(",") if name.strip())
 
     # Parse dates
-    release_date_str = movie_info.get('original_release_date')
-    streaming_date_str = movie_info.get('streaming_release_date')
-
-    release_date = None
-    streaming_date = None
-
-    if release_date_str:
-        try:
-            release_date = datetime.strptime(release_date_str, '%Y-%m-%d')
-        except ValueError:
-            # If date parsing fails, leave as None
-            pass
+    release_date_str = g('original_release_date')
+    streaming_date_str = g('streaming_release_date')
 
-    if streaming_date_str:
-        try:
-            streaming_date = datetime.strptime(streaming_date_str, '%Y-%m-%d')
-        except ValueError:
-            # If date parsing fails, leave as None
-            pass
+    # If date parsing fails, the date is left as None
+    release_date = _parse_date(release_date_str) if release_date_str else None
+    streaming_date = _parse_date(streaming_date_str) if streaming_date_str else None
 
     # Parse length (runtime)
-    length_str = movie_info.get('runtime', '')
+    length_str = g('runtime', '')
     length = None
     if length_str:
         try:
@@ -302,8 +347,8 @@ def create_movie(movie_info: dict) -> Movie:
             pass
 
     # Parse score and count
-    score_str = movie_info.get('audience_rating', '')
-    count_str = movie_info.get('audience_count', '')
+    score_str = g('audience_rating', '')
+    count_str = g('audience_count', '')
 
     score = None
     count = None
@@ -320,33 +365,121 @@ def create_movie(movie_info: dict) -> Movie:
         except ValueError:
             pass
 
-    # Get company
-    company = movie_info.get('production_company')
-
-    # Create appropriate Movie subclass based on genre
-    genre_map = {
-        'ACTION & ADVENTURE': ActionAdventure,
-        'COMEDY': Comedy,
-        'DRAMA': Drama,
-        'HORROR': Horror,
-        'ROMANCE': Romance,
-        'SCIENCE FICTION & FANTASY': ScienceFictionFantasy,
-        'WESTERN': Western
-    }
-
-    genre_class = genre_map.get(genre.upper() if genre else None)
+    # Get company (None when empty, like the other optional fields)
+    company = g('production_company') or None
+
+    # Find the Movie subclass based on genre
+    genre_class = _GENRE_MAP_CI.get(genre) or GENRE_MAP.get(genre.upper())
     if not genre_class:
         raise ValueError(f"Unknown genre: {genre}")
 
-    return genre_class(
-        rt_link=rt_link,
-        title=title,
-        rating=rating,
-        directors=directors,
-        release_date=release_date,
-        streaming_date=streaming_date,
-        length=length,
-        company=company,
-        score=score,
-        count=count
-    )
\ No newline at end of file
+    return _ParsedRow(genre_class, rt_link, title, rating_code, director_names,
+                      release_date, streaming_date, length, company, score, count)
+
+
+def _build_movie(row: _ParsedRow) -> Movie:
+    """
+    Create the Movie object for a parsed row, looking up its rating and directors.
+
+    Args:
+        row: Result of _parse_row
+
+    Returns:
+        Movie object of the appropriate genre subclass
+
+    Raises:
+        ValueError: If the rating code doesn't exist
+    """
+    return row.genre_class(
+        rt_link=row.rt_link,
+        title=row.title,
+        # get_rating raises a ValueError naming the code if it doesn't exist
+        rating=get_rating(row.rating_code),
+        directors=[get_person(name) for name in row.director_names],
+        release_date=row.release_date,
+        streaming_date=row.streaming_date,
+        length=row.length,
+        company=row.company,
+        score=row.score,
+        count=row.count
+    )
+
+
+# Factory function
+def create_movie(movie_info: dict) -> Movie:
+    """
+    Create a Movie object based on the genre.
+
+    Args:
+        movie_info: Dictionary from csv.DictReader
+
+    Returns:
+        Movie object of the appropriate genre subclass
+
+    Raises:
+        ValueError: If genre or rating doesn't exist or required fields are missing
+    """
+    return _build_movie(_parse_row(movie_info))
+
+
+def _parse_chunk(rows: List[dict]) -> List[Union[_ParsedRow, ValueError]]:
+    """
+    Parse a chunk of csv rows in a worker process.
+
+    Only plain values travel back to the parent: the Movie objects and the
+    flyweight registries stay in the parent process.
+
+    Args:
+        rows: Dictionaries from csv.DictReader
+
+    Returns:
+        One _ParsedRow per row, or the ValueError raised for a bad row
+    """
+    results: List[Union[_ParsedRow, ValueError]] = []
+    for row in rows:
+        try:
+            results.append(_parse_row(row))
+        except ValueError as e:
+            results.append(e)
+    return results
+
+
+def create_movies_parallel(
+        rows: List[dict],
+        workers: Optional[int] = None
+) -> Tuple[List[Movie], List[Tuple[int, ValueError]]]:
+    """
+    Create Movie objects for many csv rows, parsing them in worker processes.
+
+    The rows are split into one chunk per worker (len(rows) // workers + 1
+    rows each) and parsed in parallel. The Movie objects are then built
+    serially in the parent, in row order, so the rating and person
+    registries are filled there. Only worth it for large files: starting
+    the worker processes costs more than parsing a few thousand rows.
+
+    Args:
+        rows: Dictionaries from csv.DictReader
+        workers: Number of worker processes, default os.cpu_count()
+
+    Returns:
+        Tuple (movies, errors): the created Movie objects and, for each row
+        that could not be loaded, its index with the ValueError
+    """
+    workers = workers or os.cpu_count() or 1
+    size = len(rows) // workers + 1
+    chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+
+    movies: List[Movie] = []
+    errors: List[Tuple[int, ValueError]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map returns the chunks in submission order, so row indexes stay correct
+        parsed = (row for chunk in executor.map(_parse_chunk, chunks) for row in chunk)
+        for i, row in enumerate(parsed):
+            if isinstance(row, ValueError):
+                errors.append((i, row))
+                continue
+            try:
+                movies.append(_build_movie(row))
+            except ValueError as e:
+                errors.append((i, e))
+    return movies, errors
@@ -0,0 +1,134 @@
+"""
+MovieTable class: column-oriented storage (Struct of Arrays) for a movie collection.
+"""
+
+from array import array
+from itertools import compress
+from typing import Iterable, List
+
+# Import from our other modules
+from module02.movie.movie import CURRENT_YEAR, GENRE_MAP, Movie, Horror
+from module02.movie.rating import PG
+
+# Value stored in the typed arrays when an attribute is missing (None)
+MISSING = -1
+
+# Genre class -> small integer code stored in the genre_code column
+GENRE_CODES = {
+    genre_class: code for code, genre_class in enumerate(GENRE_MAP.values())
+}
+HORROR_CODE = GENRE_CODES[Horror]
+
+
+class MovieTable:
+    """
+    Stores a collection of movies column by column.
+
+    The numeric attributes are kept in typed arrays (one C integer per movie),
+    so a filter over the whole collection walks a few compact arrays instead
+    of calling a method on every Movie object. Missing values are stored as
+    MISSING. The Movie objects themselves are kept for the single-record API.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty MovieTable; use MovieTable.from_iter to fill one."""
+        self._movies: List[Movie] = []
+        self.title: List[str] = []
+        self.score = array('i')
+        self.count = array('i')
+        self.length = array('i')
+        self.release_year = array('i')
+        self.rating_order = array('b')
+        self.genre_code = array('b')
+
+    @classmethod
+    def from_iter(cls, movies: Iterable[Movie]) -> 'MovieTable':
+        """
+        Create a MovieTable from Movie objects, filling all columns in one pass.
+
+        Args:
+            movies: Movie objects to store
+
+        Returns:
+            MovieTable with one row per movie
+        """
+        table = cls()
+        for movie in movies:
+            table._movies.append(movie)
+            table.title.append(movie.title)
+            table.score.append(MISSING if movie.score is None else movie.score)
+            table.count.append(MISSING if movie.count is None else movie.count)
+            table.length.append(MISSING if movie.length is None else movie.length)
+            table.release_year.append(
+                MISSING if movie.release_date is None else movie.release_date.year
+            )
+            # MovieRating already stores its position in the order (-1 if unknown)
+            table.rating_order.append(movie.rating.order)
+            table.genre_code.append(GENRE_CODES.get(type(movie), MISSING))
+        return table
+
+    def __len__(self) -> int:
+        """Number of movies in the table."""
+        return len(self._movies)
+
+    def row(self, index: int) -> Movie:
+        """
+        Get the Movie object of a row.
+
+        Args:
+            index: Row number
+
+        Returns:
+            Movie object stored at that row
+        """
+        return self._movies[index]
+
+    def select(self, mask: Iterable[bool]) -> List[Movie]:
+        """
+        Get the Movie objects of all rows for which the mask is True.
+
+        Args:
+            mask: One boolean per row, e.g. from classic_mask()
+
+        Returns:
+            List of the selected Movie objects
+        """
+        return list(compress(self._movies, mask))
+
+    def classic_mask(self) -> List[bool]:
+        """
+        Same rule as Movie.is_classic, computed for all rows at once:
+        a relevant score higher than 80 and at least 20 years old.
+
+        Returns:
+            One boolean per row, True if the movie is a classic
+        """
+        return [
+            score > 80 and count >= 100 and year != MISSING and CURRENT_YEAR - year >= 20
+            for score, count, year in zip(self.score, self.count, self.release_year)
+        ]
+
+    def short_mask(self) -> List[bool]:
+        """
+        Same rule as Movie.is_short, computed for all rows at once:
+        shorter than 30 minutes.
+
+        Returns:
+            One boolean per row, True if the movie is a short film
+        """
+        return [length != MISSING and length < 30 for length in self.length]
+
+    def scary_mask(self) -> List[bool]:
+        """
+        Same rule as Horror.is_scary, computed for all rows at once:
+        a horror movie with a rating higher than PG.
+        Ratings outside the predefined order fall back to Horror.is_scary.
+
+        Returns:
+            One boolean per row, True if the movie is a scary horror movie
+        """
+        pg_order = PG.order
+        return [
+            genre == HORROR_CODE and (order > pg_order if order != MISSING else movie.is_scary())
+            for genre, order, movie in zip(self.genre_code, self.rating_order, self._movies)
+        ]
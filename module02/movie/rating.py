@@ -2,15 +2,21 @@
 MovieRating class implementation using PredefinedFlyweight pattern.
 """
 
+import sys
+from functools import lru_cache, total_ordering
 from typing import Dict, List
 
 
+@total_ordering
 class MovieRating:
     """
     Represents a movie content rating using the PredefinedFlyweight pattern.
     Ratings can be compared and sorted: NR < G < PG < PG-13 < R < NC17
+    (<=, > and >= are derived from __eq__ and __lt__ by total_ordering)
     """
 
+    __slots__ = ('_code', '_description', '_order')
+
     # Class variable to store all rating instances (flyweight pattern)
     _ratings: Dict[str, 'MovieRating'] = {}
 
@@ -31,8 +37,13 @@ class MovieRating:
         if not code or not description:
             raise ValueError("Code and description cannot be empty")
 
+        # Interned, so registry lookups can match the key on identity first
+        code = sys.intern(code)
         self._code = code
         self._description = description
+        # Position in the predefined order, computed once (-1 if not in the order)
+        self._order = (MovieRating._rating_order.index(code)
+                       if code in MovieRating._rating_order else -1)
 
         # Store in flyweight registry
         if code in MovieRating._ratings:
@@ -49,6 +60,11 @@ class MovieRating:
         """Get the rating description."""
         return self._description
 
+    @property
+    def order(self) -> int:
+        """Get the position in the predefined order (-1 if not in the order)."""
+        return self._order
+
     def __repr__(self) -> str:
         """String representation: Rating(code)."""
         return f"Rating({self.code})"
@@ -75,25 +91,10 @@ class MovieRating:
         if not isinstance(other, MovieRating):
             return NotImplemented
 
-        try:
-            self_index = MovieRating._rating_order.index(self.code)
-            other_index = MovieRating._rating_order.index(other.code)
-            return self_index < other_index
-        except ValueError:
-            # If code not in predefined order, fall back to string comparison
-            return self.code < other.code
-
-    def __le__(self, other: 'MovieRating') -> bool:
-        """Less than or equal comparison."""
-        return self < other or self == other
-
-    def __gt__(self, other: 'MovieRating') -> bool:
-        """Greater than comparison."""
-        return not self <= other
-
-    def __ge__(self, other: 'MovieRating') -> bool:
-        """Greater than or equal comparison."""
-        return not self < other
+        if self._order >= 0 and other._order >= 0:
+            return self._order < other._order
+        # If code not in predefined order, fall back to string comparison
+        return self.code < other.code
 
 
 def get_rating(code: str) -> MovieRating:
@@ -109,6 +110,18 @@ def get_rating(code: str) -> MovieRating:
     Raises:
         ValueError: If rating code doesn't exist
     """
+    return _resolve_rating(code)
+
+
+@lru_cache(maxsize=None)
+def _resolve_rating(code: str) -> MovieRating:
+    """
+    Lookup behind get_rating, cached on the code.
+    Only found ratings are cached (a ValueError is never cached), and
+    ratings are never removed from the registry, so the cache cannot go stale.
+    """
+    if code:
+        code = sys.intern(code)
     if code not in MovieRating._ratings:
         raise ValueError(f"Rating with code '{code}' does not exist")
     return MovieRating._ratings[code]
@@ -7,7 +7,8 @@ Voer deze test uit ter controle
 import datetime
 import unittest
 
-from module02.movie.movie import Movie, create_movie, Comedy, Horror, Romance
+from module02.movie.movie import Movie, create_movie, create_movies_parallel, Comedy, Horror, Romance
+from module02.movie.movie_table import MovieTable, MISSING
 from module02.movie.rating import MovieRating, get_rating
 from module02.person.person import Person, get_person
 
@@ -40,6 +41,19 @@ MOVIE_INFO = {
     "audience_count": "14346"
 }
 
+REQUIRED_KEYS = ("rotten_tomatoes_link", "movie_title", "content_rating", "genre")
+
+# attribuut van de Movie per optionele kolom
+EMPTY_ATTRIBUTES = {
+    "directors": "directors",
+    "original_release_date": "release_date",
+    "streaming_release_date": "streaming_date",
+    "runtime": "length",
+    "production_company": "company",
+    "audience_rating": "score",
+    "audience_count": "count"
+}
+
 
 class MyTestCase(unittest.TestCase):
     def test_movie_creation(self):
@@ -58,7 +72,7 @@ class MyTestCase(unittest.TestCase):
         self.assertIsInstance(m.rt_link, str)
         self.assertIsInstance(m.title, str)
         self.assertIsInstance(m.rating, MovieRating),
-        self.assertIsInstance(m.directors, list),
+        self.assertIsInstance(m.directors, tuple),
         self.assertIsInstance(m.directors[0], Person),
         self.assertIsInstance(m.release_date, datetime.date),
         self.assertIsInstance(m.streaming_date, datetime.date)
@@ -67,16 +81,32 @@ class MyTestCase(unittest.TestCase):
         self.assertIsInstance(m.score, int)
         self.assertIsInstance(m.count, int)
 
+    def test_score_read_only(self):
+        # score en count bepalen relevant_score, dus ze mogen niet aangepast worden
+        m = create_movie(MOVIE_INFO)
+        for attribute in ("score", "count"):
+            with self.subTest(attribute=attribute):
+                with self.assertRaises(AttributeError):
+                    setattr(m, attribute, 5)
+        self.assertTrue(m.relevant_score())
+
     def test_empty(self):
         # test of na er voldoende gecontroleerd wordt dat specifieke attributen niet leeg mogen zijn
         for key in MOVIE_INFO:
-            info_copy = MOVIE_INFO.copy()
-            info_copy[key] = ""
-            if key in ["rotten_tomatoes_link", "movie_title", "content_rating", "genre"]:
-                with self.assertRaises(ValueError):
-                    create_movie(info_copy)
-            else:
-                create_movie(info_copy)
+            with self.subTest(key=key):
+                info_copy = MOVIE_INFO.copy()
+                info_copy[key] = ""
+                if key in REQUIRED_KEYS:
+                    with self.assertRaises(ValueError):
+                        create_movie(info_copy)
+                else:
+                    # enkel het attribuut van de lege kolom moet leeg zijn
+                    m = create_movie(info_copy)
+                    value = getattr(m, EMPTY_ATTRIBUTES[key])
+                    if key == "directors":
+                        self.assertEqual(value, ())
+                    else:
+                        self.assertIsNone(value)
 
         m = create_movie(MOVIE_INFO)
         self.assertIsInstance(m, Movie)
@@ -84,7 +114,7 @@ class MyTestCase(unittest.TestCase):
         self.assertIsInstance(m.rt_link, str)
         self.assertIsInstance(m.title, str)
         self.assertIsInstance(m.rating, MovieRating),
-        self.assertIsInstance(m.directors, list),
+        self.assertIsInstance(m.directors, tuple),
         self.assertIsInstance(m.directors[0], Person),
         self.assertIsInstance(m.release_date, datetime.date),
         self.assertIsInstance(m.streaming_date, datetime.date)
@@ -93,6 +123,25 @@ class MyTestCase(unittest.TestCase):
         self.assertIsInstance(m.score, int)
         self.assertIsInstance(m.count, int)
 
+    def test_release_date_parsing(self):
+        # enkel geldige datums in het formaat YYYY-MM-DD worden ingelezen, de rest wordt None
+        cases = {
+            "1984-09-21": datetime.datetime(1984, 9, 21),
+            "1984-9-21": datetime.datetime(1984, 9, 21),
+            "1984-09-1": datetime.datetime(1984, 9, 1),
+            "2016- 1-30": None,
+            "2016-+1-30": None,
+            "2016-01-3 ": None,
+            "+984-01-01": None,
+            "2_16-01-30": None,
+            "2016-02-30": None,
+            "geen datum": None,
+        }
+        for date_str, expected in cases.items():
+            with self.subTest(date=date_str):
+                m = create_movie(dict(MOVIE_INFO, original_release_date=date_str))
+                self.assertEqual(m.release_date, expected)
+
     def test_subclass_methods(self):
         checks = ((Comedy, "is_slapstick"),
                   (Romance, "is_cosy"),
@@ -111,6 +160,22 @@ class MyTestCase(unittest.TestCase):
                     self.assertFalse(hasattr(m, f_name),
                                      f"class {class_} mag methode {f_name} niet hebben.")
 
+    def test_create_movies_parallel(self):
+        # parallel inlezen moet dezelfde films in dezelfde volgorde geven, met de foute lijnen apart
+        rows = []
+        for i, genre in enumerate(GENRES):
+            info = MOVIE_INFO.copy()
+            info.update(movie_title=f"Film {i}", genre=genre)
+            rows.append(info)
+        rows.insert(2, dict(MOVIE_INFO, genre="ONBEKEND"))
+        rows.insert(4, dict(MOVIE_INFO, content_rating="XXX"))
+        movies, errors = create_movies_parallel(rows, workers=2)
+        self.assertEqual([m.title for m in movies], [f"Film {i}" for i in range(len(GENRES))])
+        self.assertEqual([type(m) for m in movies],
+                         [type(create_movie(dict(MOVIE_INFO, genre=g))) for g in GENRES])
+        self.assertEqual([i for i, e in errors], [2, 4])
+        self.assertTrue(all(isinstance(e, ValueError) for i, e in errors))
+
 
 class PersonTestCase(unittest.TestCase):
     def test_person_creation(self):
@@ -206,5 +271,50 @@ class RatingTestCase(unittest.TestCase):
             self.assertEqual(rep, expected)
 
 
+class MovieTableTestCase(unittest.TestCase):
+    def setUp(self):
+        # een klassieker, een recente film en een film zonder datum of score
+        old = MOVIE_INFO.copy()
+        recent = MOVIE_INFO.copy()
+        recent["original_release_date"] = "2020-01-01"
+        empty = MOVIE_INFO.copy()
+        empty["original_release_date"] = ""
+        empty["audience_rating"] = ""
+        old["audience_rating"] = "90"
+        recent["audience_rating"] = "90"
+        self.movies = [create_movie(info) for info in (old, recent, empty)]
+        self.table = MovieTable.from_iter(self.movies)
+
+    def test_columns(self):
+        # controleer dat elke kolom een waarde per film bevat
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(list(self.table.score), [90, 90, MISSING])
+        self.assertEqual(list(self.table.release_year), [1984, 2020, MISSING])
+        self.assertEqual(list(self.table.length), [93, 93, 93])
+        for i, movie in enumerate(self.movies):
+            self.assertIs(self.table.row(i), movie)
+
+    def test_classic_mask(self):
+        # de masker-versie moet hetzelfde resultaat geven als Movie.is_classic
+        expected = [movie.is_classic() for movie in self.movies]
+        self.assertEqual(self.table.classic_mask(), expected)
+        self.assertEqual(expected, [True, False, False])
+        self.assertEqual(self.table.select(self.table.classic_mask()), self.movies[:1])
+
+    def test_short_and_scary_mask(self):
+        # de masker-versies moeten hetzelfde resultaat geven als is_short en is_scary
+        movies = []
+        for genre, rating, runtime in (("HORROR", "R", "20"), ("HORROR", "G", ""),
+                                       ("HORROR", "NC-17", "90"), ("DRAMA", "R", "25")):
+            info = MOVIE_INFO.copy()
+            info.update(genre=genre, content_rating=rating, runtime=runtime)
+            movies.append(create_movie(info))
+        table = MovieTable.from_iter(movies)
+        self.assertEqual(table.short_mask(), [m.is_short() for m in movies])
+        self.assertEqual(table.scary_mask(),
+                         [isinstance(m, Horror) and m.is_scary() for m in movies])
+        self.assertEqual(table.short_mask(), [True, False, False, True])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,8 @@
 Person class implementation using Flyweight Factory pattern.
 """
 
+import sys
+from functools import lru_cache
 from typing import Dict
 
 
@@ -11,6 +13,8 @@ class Person:
     Only one Person object should exist per unique full name.
     """
 
+    __slots__ = ('_full_name', '_normalized_name')
+
     # Class variable to store all person instances (flyweight pattern)
     _persons: Dict[str, 'Person'] = {}
 
@@ -27,9 +31,10 @@ class Person:
         if not full_name or not full_name.strip():
             raise ValueError("Full name cannot be empty")
 
-        # Store the normalized name (lowercase for case-insensitive comparison)
+        # Store the normalized name (lowercase for case-insensitive comparison).
+        # It is interned, so registry lookups and __eq__ can match on identity first.
         self._full_name = full_name.strip()
-        self._normalized_name = self._full_name.lower()
+        self._normalized_name = sys.intern(self._full_name.lower())
 
         # Check if a person with this name already exists (case-insensitive)
         if self._normalized_name in Person._persons:
@@ -80,11 +85,22 @@ def get_person(full_name: str) -> Person:
     Raises:
         ValueError: If full_name is empty
     """
+    return _resolve_person(full_name)
+
+
+@lru_cache(maxsize=None)
+def _resolve_person(full_name: str) -> Person:
+    """
+    Lookup behind get_person, cached on the raw name.
+    The same director name appears many times in a csv file; repeated
+    calls then skip the strip/lower normalization and the registry lookup.
+    Persons are never removed from the registry, so the cache cannot go stale.
+    """
     if not full_name or not full_name.strip():
         raise ValueError("Full name cannot be empty")
 
     full_name = full_name.strip()
-    normalized_name = full_name.lower()
+    normalized_name = sys.intern(full_name.lower())
 
     # Check if person already exists
     if normalized_name in Person._persons: